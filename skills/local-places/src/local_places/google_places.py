@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib.util
 import logging
 import os
 from typing import Any
@@ -21,8 +22,20 @@ from local_places.schemas import (
 GOOGLE_PLACES_BASE_URL = os.getenv(
     "GOOGLE_PLACES_BASE_URL", "https://places.googleapis.com/v1"
 )
+_SEARCH_TEXT_URL = f"{GOOGLE_PLACES_BASE_URL}/places:searchText"
 logger = logging.getLogger("local_places.google_places")
 
+# Shared across requests so TCP/TLS connections to Google are kept alive;
+# HTTP/2 lets concurrent requests multiplex over a single connection when h2
+# is installed (older venvs fall back to HTTP/1.1 rather than failing).
+# Failed connection attempts are retried with exponential backoff.
+_client = httpx.Client(
+    timeout=10.0,
+    transport=httpx.HTTPTransport(
+        http2=importlib.util.find_spec("h2") is not None, retries=2
+    ),
+)
+
 _PRICE_LEVEL_TO_ENUM = {
     0: "PRICE_LEVEL_FREE",
     1: "PRICE_LEVEL_INEXPENSIVE",
@@ -98,13 +111,12 @@ def _request(
     method: str, url: str, payload: dict[str, Any] | None, field_mask: str
 ) -> _GoogleResponse:
     try:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.request(
-                method=method,
-                url=url,
-                headers=_api_headers(field_mask),
-                json=payload,
-            )
+        response = _client.request(
+            method=method,
+            url=url,
+            headers=_api_headers(field_mask),
+            json=payload,
+        )
     except httpx.HTTPError as exc:
         raise HTTPException(status_code=502, detail="Google Places API unavailable.") from exc
 
@@ -189,8 +201,9 @@ def _parse_price_level(raw: str | None) -> int | None:
 
 
 def search_places(request: SearchRequest) -> SearchResponse:
-    url = f"{GOOGLE_PLACES_BASE_URL}/places:searchText"
-    response = _request("POST", url, _build_search_body(request), _SEARCH_FIELD_MASK)
+    response = _request(
+        "POST", _SEARCH_TEXT_URL, _build_search_body(request), _SEARCH_FIELD_MASK
+    )
 
     if response.status_code >= 400:
         logger.error(
@@ -274,9 +287,8 @@ def get_place_details(place_id: str) -> PlaceDetails:
 
 
 def resolve_locations(request: LocationResolveRequest) -> LocationResolveResponse:
-    url = f"{GOOGLE_PLACES_BASE_URL}/places:searchText"
     body = {"textQuery": request.location_text, "pageSize": request.limit}
-    response = _request("POST", url, body, _RESOLVE_FIELD_MASK)
+    response = _request("POST", _SEARCH_TEXT_URL, body, _RESOLVE_FIELD_MASK)
 
     if response.status_code >= 400:
         logger.error(
@@ -6,16 +6,23 @@ import json
 import os
 import random
 import re
+import socket
 import sys
+import time
 import urllib.error
 import urllib.request
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from pathlib import Path
 
 
+_NON_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_DASH_RUN_RE = re.compile(r"-{2,}")
+
+
 def slugify(text: str) -> str:
     text = text.lower().strip()
-    text = re.sub(r"[^a-z0-9]+", "-", text)
-    text = re.sub(r"-{2,}", "-", text).strip("-")
+    text = _NON_SLUG_RE.sub("-", text)
+    text = _DASH_RUN_RE.sub("-", text).strip("-")
     return text or "image"
 
 
@@ -23,43 +30,63 @@ def default_out_dir() -> Path:
     now = dt.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
     preferred = Path.home() / "Projects" / "tmp"
     base = preferred if preferred.is_dir() else Path("./tmp")
-    base.mkdir(parents=True, exist_ok=True)
     return base / f"openai-image-gen-{now}"
 
 
+_PROMPT_SUBJECTS = (
+    "a lobster astronaut",
+    "a brutalist lighthouse",
+    "a cozy reading nook",
+    "a cyberpunk noodle shop",
+    "a Vienna street at dusk",
+    "a minimalist product photo",
+    "a surreal underwater library",
+)
+_PROMPT_STYLES = (
+    "ultra-detailed studio photo",
+    "35mm film still",
+    "isometric illustration",
+    "editorial photography",
+    "soft watercolor",
+    "architectural render",
+    "high-contrast monochrome",
+)
+_PROMPT_LIGHTING = (
+    "golden hour",
+    "overcast soft light",
+    "neon lighting",
+    "dramatic rim light",
+    "candlelight",
+    "foggy atmosphere",
+)
+
+
 def pick_prompts(count: int) -> list[str]:
-    subjects = [
-        "a lobster astronaut",
-        "a brutalist lighthouse",
-        "a cozy reading nook",
-        "a cyberpunk noodle shop",
-        "a Vienna street at dusk",
-        "a minimalist product photo",
-        "a surreal underwater library",
-    ]
-    styles = [
-        "ultra-detailed studio photo",
-        "35mm film still",
-        "isometric illustration",
-        "editorial photography",
-        "soft watercolor",
-        "architectural render",
-        "high-contrast monochrome",
+    return [
+        f"{random.choice(_PROMPT_STYLES)} of {random.choice(_PROMPT_SUBJECTS)}, "
+        f"{random.choice(_PROMPT_LIGHTING)}"
+        for _ in range(count)
     ]
-    lighting = [
-        "golden hour",
-        "overcast soft light",
-        "neon lighting",
-        "dramatic rim light",
-        "candlelight",
-        "foggy atmosphere",
-    ]
-    prompts: list[str] = []
-    for _ in range(count):
-        prompts.append(
-            f"{random.choice(styles)} of {random.choice(subjects)}, {random.choice(lighting)}"
-        )
-    return prompts
+
+
+_MAX_ATTEMPTS = 4
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRY_AFTER = 60.0
+
+
+def _backoff(attempt: int) -> float:
+    # Exponential backoff with jitter so parallel workers don't retry in lockstep.
+    return min(30.0, 2.0**attempt) + random.uniform(0, 1)
+
+
+def _is_transient(exc: BaseException) -> bool:
+    # urlopen wraps connect-time failures in URLError, while read timeouts and
+    # resets from getresponse() surface bare. Certificate errors and NXDOMAIN
+    # will not fix themselves, so only retry dropped/timed-out connections.
+    reason = exc.reason if isinstance(exc, urllib.error.URLError) else exc
+    if isinstance(reason, socket.gaierror):
+        return reason.errno == socket.EAI_AGAIN
+    return isinstance(reason, (ConnectionError, TimeoutError))
 
 
 def request_images(
@@ -89,12 +116,49 @@ def request_images(
         },
         data=body,
     )
-    try:
-        with urllib.request.urlopen(req, timeout=300) as resp:
-            return json.loads(resp.read().decode("utf-8"))
-    except urllib.error.HTTPError as e:
-        payload = e.read().decode("utf-8", errors="replace")
-        raise RuntimeError(f"OpenAI Images API failed ({e.code}): {payload}") from e
+    attempt = 0
+    while True:
+        last = attempt + 1 >= _MAX_ATTEMPTS
+        try:
+            with urllib.request.urlopen(req, timeout=300) as resp:
+                return json.loads(resp.read().decode("utf-8"))
+        except urllib.error.HTTPError as e:
+            if last or e.code not in _RETRY_STATUSES:
+                payload = e.read().decode("utf-8", errors="replace")
+                raise RuntimeError(f"OpenAI Images API failed ({e.code}): {payload}") from e
+            retry_after = e.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = min(float(retry_after), _MAX_RETRY_AFTER)
+            else:
+                delay = _backoff(attempt)
+            e.close()
+        except (urllib.error.URLError, ConnectionError, TimeoutError) as e:
+            if last or not _is_transient(e):
+                raise
+            delay = _backoff(attempt)
+        time.sleep(delay)
+        attempt += 1
+
+
+def generate_one(
+    api_key: str,
+    out_dir: Path,
+    idx: int,
+    total: int,
+    prompt: str,
+    model: str,
+    size: str,
+    quality: str,
+) -> dict:
+    print(f"[{idx}/{total}] {prompt}", flush=True)
+    res = request_images(api_key, prompt, model, size, quality)
+    b64 = res.get("data", [{}])[0].get("b64_json")
+    if not b64:
+        raise RuntimeError(f"Unexpected response: {json.dumps(res)[:400]}")
+    png = base64.b64decode(b64)
+    filename = f"{idx:03d}-{slugify(prompt)[:40]}.png"
+    (out_dir / filename).write_bytes(png)
+    return {"prompt": prompt, "file": filename}
 
 
 def write_gallery(out_dir: Path, items: list[dict]) -> None:
@@ -139,6 +203,7 @@ def main() -> int:
     ap.add_argument("--size", default="1024x1024", help="Image size (e.g. 1024x1024, 1536x1024).")
     ap.add_argument("--quality", default="high", help="Image quality (varies by model).")
     ap.add_argument("--out-dir", default="", help="Output directory (default: ./tmp/openai-image-gen-<ts>).")
+    ap.add_argument("--concurrency", type=int, default=1, help="How many images to request in parallel.")
     args = ap.parse_args()
 
     api_key = (os.environ.get("OPENAI_API_KEY") or "").strip()
@@ -151,17 +216,29 @@ def main() -> int:
 
     prompts = [args.prompt] * args.count if args.prompt else pick_prompts(args.count)
 
-    items: list[dict] = []
-    for idx, prompt in enumerate(prompts, start=1):
-        print(f"[{idx}/{len(prompts)}] {prompt}")
-        res = request_images(api_key, prompt, args.model, args.size, args.quality)
-        b64 = res.get("data", [{}])[0].get("b64_json")
-        if not b64:
-            raise RuntimeError(f"Unexpected response: {json.dumps(res)[:400]}")
-        png = base64.b64decode(b64)
-        filename = f"{idx:03d}-{slugify(prompt)[:40]}.png"
-        (out_dir / filename).write_bytes(png)
-        items.append({"prompt": prompt, "file": filename})
+    total = len(prompts)
+    jobs = [
+        (api_key, out_dir, idx, total, prompt, args.model, args.size, args.quality)
+        for idx, prompt in enumerate(prompts, start=1)
+    ]
+    if args.concurrency <= 1:
+        items: list[dict] = [generate_one(*job) for job in jobs]
+    else:
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            futures = [pool.submit(generate_one, *job) for job in jobs]
+            try:
+                # Wake on whichever image fails first, not in submission order,
+                # so queued requests are dropped before workers pay for them.
+                done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+                for f in done:
+                    exc = f.exception()
+                    if exc is not None:
+                        raise exc
+                items = [f.result() for f in futures]
+            except BaseException:
+                # Also covers Ctrl-C: stop like the serial path does.
+                pool.shutdown(cancel_futures=True)
+                raise
 
     (out_dir / "prompts.json").write_text(json.dumps(items, indent=2), encoding="utf-8")
     write_gallery(out_dir, items)
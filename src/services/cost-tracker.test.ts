@@ -0,0 +1,155 @@
+import fs from "node:fs";
+import os from "node:os";
+import path from "node:path";
+import { afterEach, beforeEach, describe, expect, it, vi } from "vitest";
+
+import { readCostLog, trackCost } from "./cost-tracker.js";
+
+const DATE = "2024-03-10";
+const DAY_START = Date.UTC(2024, 2, 10);
+const HOUR = 60 * 60 * 1000;
+
+let tmpDir: string;
+let previousStateDir: string | undefined;
+
+function logPath(): string {
+  return path.join(tmpDir, "cost-log.jsonl");
+}
+
+function entryLine(timestamp: number, sessionId: string): string {
+  const entry = { timestamp, sessionId, model: "claude-sonnet-4" };
+  return `${JSON.stringify(entry)}\n`;
+}
+
+beforeEach(() => {
+  tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), "cost-tracker-test-"));
+  previousStateDir = process.env.CLAWDIS_STATE_DIR;
+  process.env.CLAWDIS_STATE_DIR = tmpDir;
+});
+
+afterEach(() => {
+  if (previousStateDir === undefined) {
+    delete process.env.CLAWDIS_STATE_DIR;
+  } else {
+    process.env.CLAWDIS_STATE_DIR = previousStateDir;
+  }
+  fs.rmSync(tmpDir, { recursive: true, force: true });
+});
+
+describe("readCostLog cache", () => {
+  it("serves repeat reads from cache while the file is unchanged", async () => {
+    // Pin a whole-second mtime so it survives the utimes round trip exactly.
+    const mtime = new Date(DAY_START + 12 * HOUR);
+    fs.writeFileSync(logPath(), entryLine(DAY_START + HOUR, "aaaa"));
+    fs.utimesSync(logPath(), mtime, mtime);
+    const first = await readCostLog(DATE);
+    expect(first.map((e) => e.sessionId)).toEqual(["aaaa"]);
+
+    // Same size and mtime, different content: only a cache hit sees "aaaa".
+    fs.writeFileSync(logPath(), entryLine(DAY_START + HOUR, "bbbb"));
+    fs.utimesSync(logPath(), mtime, mtime);
+
+    const second = await readCostLog(DATE);
+    expect(second.map((e) => e.sessionId)).toEqual(["aaaa"]);
+  });
+
+  it("re-reads the log after an append changes its size", async () => {
+    fs.writeFileSync(logPath(), entryLine(DAY_START + HOUR, "first"));
+    expect(await readCostLog(DATE)).toHaveLength(1);
+
+    fs.appendFileSync(logPath(), entryLine(DAY_START + 2 * HOUR, "second"));
+    const entries = await readCostLog(DATE);
+    expect(entries.map((e) => e.sessionId)).toEqual(["first", "second"]);
+  });
+
+  it("returns a copy so callers cannot mutate the cached entries", async () => {
+    fs.writeFileSync(logPath(), entryLine(DAY_START + HOUR, "kept"));
+    const first = await readCostLog(DATE);
+    first.length = 0;
+
+    const second = await readCostLog(DATE);
+    expect(second.map((e) => e.sessionId)).toEqual(["kept"]);
+  });
+});
+
+describe("readCostLog timestamp prefix filter", () => {
+  async function readWithParseSpy(lines: string[]) {
+    fs.writeFileSync(logPath(), `${lines.join("\n")}\n`);
+    const parseSpy = vi.spyOn(JSON, "parse");
+    try {
+      const entries = await readCostLog(DATE);
+      const parsed = (line: string) =>
+        parseSpy.mock.calls.some(([text]) => text === line);
+      return { entries, parsed };
+    } finally {
+      parseSpy.mockRestore();
+    }
+  }
+
+  it("skips lines from other days without parsing them", async () => {
+    const other = entryLine(DAY_START - HOUR, "yesterday").trimEnd();
+    const { entries, parsed } = await readWithParseSpy([other]);
+    expect(entries).toEqual([]);
+    expect(parsed(other)).toBe(false);
+  });
+
+  it("keeps lines from the requested day", async () => {
+    const today = entryLine(DAY_START + HOUR, "today").trimEnd();
+    const { entries, parsed } = await readWithParseSpy([today]);
+    expect(entries.map((e) => e.sessionId)).toEqual(["today"]);
+    expect(parsed(today)).toBe(true);
+  });
+
+  it("parses lines whose first key is not timestamp", async () => {
+    const reordered = JSON.stringify({
+      sessionId: "reordered",
+      timestamp: DAY_START + HOUR,
+    });
+    const { entries, parsed } = await readWithParseSpy([reordered]);
+    expect(entries.map((e) => e.sessionId)).toEqual(["reordered"]);
+    expect(parsed(reordered)).toBe(true);
+  });
+
+  it("falls back to JSON.parse for a non-numeric prefix", async () => {
+    const stringStamp = JSON.stringify({
+      timestamp: "2024-03-10T01:00:00Z",
+      sessionId: "string-stamp",
+    });
+    const { entries, parsed } = await readWithParseSpy([stringStamp]);
+    expect(parsed(stringStamp)).toBe(true);
+    // A string timestamp never falls inside the numeric day range.
+    expect(entries).toEqual([]);
+  });
+});
+
+describe("appendCostLog", () => {
+  function track(sessionId: string) {
+    trackCost({
+      sessionId,
+      model: "claude-sonnet-4",
+      inputTokens: 10,
+      outputTokens: 5,
+    });
+  }
+
+  function loggedSessions(): string[] {
+    return fs
+      .readFileSync(logPath(), "utf-8")
+      .trimEnd()
+      .split("\n")
+      .map((line) => JSON.parse(line).sessionId);
+  }
+
+  it("recreates a state dir removed after the first append", async () => {
+    track("before-delete");
+    await vi.waitFor(() => expect(fs.existsSync(logPath())).toBe(true));
+
+    fs.rmSync(tmpDir, { recursive: true, force: true });
+    track("after-delete");
+
+    await vi.waitFor(() => {
+      expect(fs.existsSync(logPath())).toBe(true);
+      expect(loggedSessions()).toEqual(["after-delete"]);
+    });
+  });
+});
@@ -140,10 +140,25 @@ function getMonthKey(): string {
   return new Date().toISOString().slice(0, 7);
 }
 
+/** Resolved pricing per model ID, so the fallback matching runs once. */
+const resolvedPricing = new Map<string, ModelPricing>();
+
 /**
  * Look up pricing for a given model ID.
  */
 function getModelPricing(model: string): ModelPricing {
+  let pricing = resolvedPricing.get(model);
+  if (!pricing) {
+    pricing = resolveModelPricing(model);
+    resolvedPricing.set(model, pricing);
+  }
+  return pricing;
+}
+
+/**
+ * Match a model ID against the known pricing table.
+ */
+function resolveModelPricing(model: string): ModelPricing {
   // Try exact match first
   if (MODEL_PRICING[model]) return MODEL_PRICING[model];
 
@@ -178,10 +193,11 @@ function calculateCostUsd(
   cacheWrite: number,
 ): number {
   return (
-    (input / 1_000_000) * pricing.inputPerMillion +
-    (output / 1_000_000) * pricing.outputPerMillion +
-    (cacheRead / 1_000_000) * pricing.cacheReadPerMillion +
-    (cacheWrite / 1_000_000) * pricing.cacheWritePerMillion
+    (input * pricing.inputPerMillion +
+      output * pricing.outputPerMillion +
+      cacheRead * pricing.cacheReadPerMillion +
+      cacheWrite * pricing.cacheWritePerMillion) /
+    1_000_000
   );
 }
 
@@ -205,11 +221,13 @@ function getOrCreateDailySummary(): DailySummary {
     };
     dailyCosts.set(today, summary);
 
-    // Clean up old entries (keep last 7 days)
-    const cutoff = Date.now() - 7 * 24 * 60 * 60 * 1000;
-    for (const [key] of dailyCosts) {
-      const date = new Date(key).getTime();
-      if (date < cutoff) dailyCosts.delete(key);
+    // Clean up old entries (keep last 7 days). YYYY-MM-DD keys sort
+    // chronologically, so compare them as strings instead of parsing dates.
+    const cutoff = new Date(Date.now() - 7 * 24 * 60 * 60 * 1000)
+      .toISOString()
+      .slice(0, 10);
+    for (const key of dailyCosts.keys()) {
+      if (key <= cutoff) dailyCosts.delete(key);
     }
   }
   return summary;
@@ -296,6 +314,8 @@ export function trackCost(params: {
 
   const budgetRemaining = Math.max(0, DAILY_BUDGET_GBP - summary.totalCostGbp);
 
+  // `timestamp` must stay the first key: readCostLog peeks at it in the raw
+  // JSONL line to skip other days' entries without parsing them.
   const entry: CostEntry = {
     timestamp: Date.now(),
     sessionId: params.sessionId,
@@ -410,17 +430,57 @@ function resolveCostLogPath(): string {
   return path.join(stateDir, "cost-log.jsonl");
 }
 
+/** Directories already created for the cost log (skips mkdir per append). */
+const ensuredLogDirs = new Set<string>();
+
 /**
  * Append a cost entry to the JSONL log file.
  */
 async function appendCostLog(entry: CostEntry): Promise<void> {
   const logPath = resolveCostLogPath();
   const dir = path.dirname(logPath);
-  await fs.promises.mkdir(dir, { recursive: true });
   const line = `${JSON.stringify(entry)}\n`;
-  await fs.promises.appendFile(logPath, line, "utf-8");
+  if (!ensuredLogDirs.has(dir)) {
+    await fs.promises.mkdir(dir, { recursive: true });
+    ensuredLogDirs.add(dir);
+  }
+  try {
+    await fs.promises.appendFile(logPath, line, "utf-8");
+  } catch (err) {
+    const code =
+      err && typeof err === "object" && "code" in err
+        ? String((err as { code?: unknown }).code)
+        : null;
+    if (code !== "ENOENT") throw err;
+    // The state dir was removed after we created it; recreate and retry once.
+    await fs.promises.mkdir(dir, { recursive: true });
+    await fs.promises.appendFile(logPath, line, "utf-8");
+  }
 }
 
+/** appendCostLog serializes every entry with `timestamp` as its first key. */
+const TIMESTAMP_PREFIX = '{"timestamp":';
+
+/**
+ * Read the leading timestamp of a cost log line without parsing the JSON.
+ * Returns undefined when the line does not have the expected shape.
+ */
+function peekTimestamp(line: string): number | undefined {
+  if (!line.startsWith(TIMESTAMP_PREFIX)) return undefined;
+  const end = line.indexOf(",", TIMESTAMP_PREFIX.length);
+  if (end === -1) return undefined;
+  const value = Number(line.slice(TIMESTAMP_PREFIX.length, end));
+  return Number.isFinite(value) ? value : undefined;
+}
+
+/**
+ * Parsed entries for the most recently read (log path, date), invalidated by
+ * file mtime/size. Only one key is kept so memory stays bounded.
+ */
+let costLogCache:
+  | { key: string; mtimeMs: number; size: number; entries: CostEntry[] }
+  | undefined;
+
 /**
  * Read all cost entries for a given date (YYYY-MM-DD).
  * Returns entries from the JSONL log file.
@@ -434,10 +494,29 @@ export async function readCostLog(date?: string): Promise<CostEntry[]> {
   const dayEnd = dayStart + 24 * 60 * 60 * 1000;
 
   try {
+    // Reuse the previous parse while the log file is unchanged.
+    const stat = await fs.promises.stat(logPath);
+    const cacheKey = `${logPath}\u0000${targetDate}`;
+    const cached = costLogCache;
+    if (
+      cached?.key === cacheKey &&
+      cached.mtimeMs === stat.mtimeMs &&
+      cached.size === stat.size
+    ) {
+      return [...cached.entries];
+    }
+
     const content = await fs.promises.readFile(logPath, "utf-8");
     const entries: CostEntry[] = [];
     for (const line of content.split("\n")) {
-      if (!line.trim()) continue;
+      // Every entry is a JSON object; this also skips blank lines without
+      // allocating a trimmed copy of each line.
+      if (line.charCodeAt(0) !== 0x7b) continue;
+      // Skip entries from other days before paying for JSON.parse.
+      const stamp = peekTimestamp(line);
+      if (stamp !== undefined && (stamp < dayStart || stamp >= dayEnd)) {
+        continue;
+      }
       try {
         const entry = JSON.parse(line) as CostEntry;
         if (entry.timestamp >= dayStart && entry.timestamp < dayEnd) {
@@ -447,7 +526,13 @@ export async function readCostLog(date?: string): Promise<CostEntry[]> {
         // Skip malformed lines
       }
     }
-    return entries;
+    costLogCache = {
+      key: cacheKey,
+      mtimeMs: stat.mtimeMs,
+      size: stat.size,
+      entries,
+    };
+    return [...entries];
   } catch {
     return [];
   }
@@ -464,18 +549,21 @@ export async function generateCostReport(date?: string): Promise<string> {
     return `Cost Report for ${targetDate}: No data available.`;
   }
 
-  const totalCostUsd = entries.reduce((sum, e) => sum + e.costUsd, 0);
-  const totalCostGbp = entries.reduce((sum, e) => sum + e.costGbp, 0);
-  const totalInput = entries.reduce((sum, e) => sum + e.inputTokens, 0);
-  const totalOutput = entries.reduce((sum, e) => sum + e.outputTokens, 0);
-  const totalCacheRead = entries.reduce(
-    (sum, e) => sum + (e.cacheReadTokens ?? 0),
-    0,
-  );
-  const totalCacheWrite = entries.reduce(
-    (sum, e) => sum + (e.cacheWriteTokens ?? 0),
-    0,
-  );
+  // Accumulate all totals in a single pass over the entries.
+  let totalCostUsd = 0;
+  let totalCostGbp = 0;
+  let totalInput = 0;
+  let totalOutput = 0;
+  let totalCacheRead = 0;
+  let totalCacheWrite = 0;
+  for (const e of entries) {
+    totalCostUsd += e.costUsd;
+    totalCostGbp += e.costGbp;
+    totalInput += e.inputTokens;
+    totalOutput += e.outputTokens;
+    totalCacheRead += e.cacheReadTokens ?? 0;
+    totalCacheWrite += e.cacheWriteTokens ?? 0;
+  }
   const avgCostPerMsg = totalCostGbp / entries.length;
 
   // Cache hit rate: proportion of input served from cache